@@ -12,6 +12,7 @@ import sys
 import argparse
 import json
 import tempfile
+import copy
 import shutil
 import time
 import re
@@ -21,14 +22,16 @@ import subprocess
 import threading
 import queue
 import logging
+import traceback
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import importlib.util
 import signal
+import atexit
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union, Any
-from functools import partial
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import webbrowser
-import shutil
 
 # Check if packages are installed before importing
 try:
@@ -50,10 +53,18 @@ except ImportError:
 
 try:
     import spotipy
-    from spotipy.oauth2 import SpotifyClientCredentials
+    from spotipy.oauth2 import SpotifyClientCredentials, SpotifyOauthError
+    from spotipy.cache_handler import CacheFileHandler
 except ImportError:
     sys.exit("Required package 'spotipy' is missing. Please install it with: pip install spotipy")
 
+# Optional faster JSON parser for config loading
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Define platform constants for better readability
 IS_WINDOWS = sys.platform.startswith('win')
 IS_MACOS = sys.platform == 'darwin'
@@ -61,6 +72,7 @@ IS_LINUX = sys.platform.startswith('linux')
 
 # Import platform-specific modules
 if IS_WINDOWS:
+    import ctypes  # For GetDriveTypeW optical drive detection
     try:
         import msvcrt  # For Windows key detection
     except ImportError:
@@ -96,14 +108,114 @@ console = Console(width=None)  # width=None makes it auto-detect terminal width
 MIN_TERMINAL_WIDTH = 100
 MIN_TERMINAL_HEIGHT = 30
 
+# File extensions counted as tracks when scanning the music library
+LIBRARY_AUDIO_EXTENSIONS = ('.mp3', '.flac', '.ogg', '.opus', '.m4a', '.wav')
+# A folder containing only these is burned as an audio CD rather than a data disc
+BURN_AUDIO_EXTENSIONS = ('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac')
+# File extensions shown in the video library, and yt-dlp audio-only outputs
+VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.webm', '.avi', '.mov', '.flv')
+VIDEO_AUDIO_EXTENSIONS = ('.m4a', '.mp3', '.opus')
+
+# Upper bound on concurrent Spotify Web API requests issued by a single operation
+SPOTIFY_MAX_CONCURRENT_REQUESTS = 3
+
+# Retry policy for rate-limited (429) and transient server errors from the Spotify API
+SPOTIFY_API_RETRIES = 5
+SPOTIFY_API_BACKOFF_FACTOR = 0.5
+# Only the playlist track fields display_music_info reads, plus paging info
+SPOTIFY_PLAYLIST_TRACK_FIELDS = (
+    "items(track(name,duration_ms,artists(name),album(name),external_urls(spotify))),"
+    "total,limit,offset"
+)
+# Seconds an album/playlist track listing is reused before refetching
+SPOTIFY_TRACK_CACHE_TTL = 300
+# Per-user application data (logs, token cache) lives under the home folder
+APP_DATA_DIR = os.path.join(os.path.expanduser("~"), ".spotify_burner")
+LOG_DIR = os.path.join(APP_DATA_DIR, "logs")
+LOG_FILE = os.path.join(LOG_DIR, "spotify_burner.log")
+# Client-credentials tokens are valid for an hour; keep them across runs
+SPOTIFY_TOKEN_CACHE_PATH = os.path.join(APP_DATA_DIR, ".spotipy_cache")
+
+# Theme definitions
+THEMES = {
+    "default": {
+        "main_color": "cyan",
+        "accent_color": "green", 
+        "warning_color": "yellow",
+        "error_color": "red",
+        "success_color": "green",
+        "header_style": "bold blue",
+        "border_style": "cyan",
+        "box_type": box.ROUNDED
+    },
+    "dark": {
+        "main_color": "blue", 
+        "accent_color": "cyan",
+        "warning_color": "yellow",
+        "error_color": "red",
+        "success_color": "green",
+        "header_style": "bold cyan",
+        "border_style": "blue",
+        "box_type": box.HEAVY
+    },
+    "light": {
+        "main_color": "magenta",
+        "accent_color": "blue",
+        "warning_color": "orange3",
+        "error_color": "red",
+        "success_color": "green",
+        "header_style": "bold magenta",
+        "border_style": "magenta",
+        "box_type": box.SQUARE
+    },
+    "modern": {
+        "main_color": "bright_blue",
+        "accent_color": "bright_cyan",
+        "warning_color": "gold1",
+        "error_color": "bright_red",
+        "success_color": "bright_green",
+        "header_style": "bold bright_blue",
+        "border_style": "bright_blue",
+        "box_type": box.ROUNDED
+    },
+    "neon": {
+        "main_color": "hot_pink",
+        "accent_color": "bright_cyan",
+        "warning_color": "bright_yellow",
+        "error_color": "bright_red",
+        "success_color": "bright_green",
+        "header_style": "bold hot_pink",
+        "border_style": "purple",
+        "box_type": box.DOUBLE
+    },
+    "spotify": {
+        "main_color": "green4",
+        "accent_color": "green1",
+        "warning_color": "yellow",
+        "error_color": "red",
+        "success_color": "green",
+        "header_style": "bold green",
+        "border_style": "green",
+        "box_type": box.ROUNDED
+    }
+}
+
+# Theme picker menu number -> theme name
+THEME_CHOICES = {
+    "1": "default",
+    "2": "dark",
+    "3": "light",
+    "4": "modern",
+    "5": "neon",
+    "6": "spotify",
+}
+
 # Configure logging with proper paths
 def setup_logging():
     """Set up logging with proper file paths and rotation"""
     try:
         # Create log directory in user's home folder for better portability
-        log_dir = os.path.join(os.path.expanduser("~"), ".spotify_burner", "logs")
-        os.makedirs(log_dir, exist_ok=True)
-        log_path = os.path.join(log_dir, "spotify_burner.log")
+        os.makedirs(LOG_DIR, exist_ok=True)
         
         # Get log level from environment or default to INFO
         log_level_name = os.environ.get("LOG_LEVEL", "INFO")
@@ -124,19 +236,19 @@ def setup_logging():
         
         # Add a rotating file handler
         try:
-            # Try to use a rotating handler if available
-            try:
-                from logging.handlers import RotatingFileHandler
-                file_handler = RotatingFileHandler(
-                    log_path, maxBytes=10*1024*1024, backupCount=5, encoding='utf-8'
-                )
-            except ImportError:
-                # Fall back to standard file handler if rotating handler is not available
-                file_handler = logging.FileHandler(log_path, encoding='utf-8')
-                
+            file_handler = RotatingFileHandler(
+                LOG_FILE, maxBytes=10*1024*1024, backupCount=5, encoding='utf-8'
+            )
             file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+            
+            # Hand records to a single writer thread so download workers never
+            # block on log file writes and rotation
+            log_queue = queue.Queue()
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            logger.addHandler(QueueHandler(log_queue))
         except (PermissionError, OSError) as e:
             print(f"Warning: Could not set up file logging: {e}")
             
@@ -157,11 +269,18 @@ def setup_logging():
         )
         return logging.getLogger("spotify_burner")
 
-# Initialize logger
-logger = setup_logging()
+# Module logger; handlers are attached lazily by init_runtime()
+logger = logging.getLogger("spotify_burner")
 
-# Load environment variables from .env file
-dotenv.load_dotenv()
+@lru_cache(maxsize=1)
+def init_runtime():
+    """Load the .env file and configure logging, once per process.
+    
+    Deferred from import time so importing this module does no file I/O.
+    The .env file is loaded first so LOG_LEVEL can be set there.
+    """
+    dotenv.load_dotenv()
+    setup_logging()
 
 # Constants
 DEFAULT_OUTPUT_DIR = os.path.join(os.path.expanduser("~"), "Music", "SpotifyDownloads")
@@ -339,10 +458,11 @@ def create_responsive_table(columns, show_header=True, title=None, box_style=Non
         rich.table.Table: A configured responsive table
     """
     # Get theme settings if not specified
+    theme = app_state.get("theme", {})
     if box_style is None:
-        box_style = app_state["theme"]["box"] if "theme" in app_state else box.ROUNDED
+        box_style = theme.get("box", box.ROUNDED)
     if border_style is None:
-        border_style = app_state["theme"]["border"] if "theme" in app_state else "cyan"
+        border_style = theme.get("border", "cyan")
         
     # Determine if we should use compact mode
     if compact_mode is None:
@@ -439,6 +559,63 @@ def create_responsive_table(columns, show_header=True, title=None, box_style=Non
         
     return table
 
+# Characters that are invalid in Windows file and folder names are mapped to '_',
+# control characters are removed
+INVALID_PATH_CHARS = str.maketrans({
+    **{c: '_' for c in '<>:"/\\|?*'},
+    **{chr(c): None for c in range(0x20)},
+    '\x7f': None
+})
+# Leading or trailing dots/whitespace, which Windows silently drops from names
+PATH_EDGE_TRIM_RE = re.compile(r'^[.\s]+|[.\s]+$')
+# Device names Windows reserves regardless of extension (CON, COM1, LPT1.txt, ...)
+RESERVED_PATH_NAME_RE = re.compile(r'^(CON|PRN|AUX|NUL|COM[1-9]|LPT[1-9])(\.|$)', re.IGNORECASE)
+# Keep names well below the 255 character component limit so extensions still fit
+MAX_PATH_COMPONENT_LENGTH = 200
+# Drive letter in CDBurnerXP --list-drives output: "(H:\)" or "Drive D:\"
+CDBURNERXP_DRIVE_RE = re.compile(r'\(([A-Z]):\\?\)|Drive\s+([A-Z]):')
+# Characters not allowed in a disc volume label
+DISC_LABEL_INVALID_RE = re.compile(r'[^\w\s-]')
+
+# Resolution ('1920x1080' or '1080p') and frame rate tokens in video/format names
+VIDEO_RESOLUTION_RE = re.compile(r'(\d{3,4}x\d{3,4}|\d{3,4}p)')
+VIDEO_DIMENSIONS_RE = re.compile(r'(\d{3,4}x\d{3,4})')
+VIDEO_PROGRESSIVE_RE = re.compile(r'(\d{3,4}p)')
+VIDEO_FPS_RE = re.compile(r'(\d{2,3})fps')
+
+# Spotify URL recorded in a spotdl partial-download sidecar file
+SPOTIFY_URL_RE = re.compile(r'https://open\.spotify\.com/[^\s"\']+')
+
+def sanitize_path_component(name, fallback):
+    """Make a string safe to use as a single file or folder name.
+    
+    Args:
+        name: Raw name, e.g. "Artist - Album"
+        fallback: Name to use if nothing is left after sanitizing
+        
+    Returns:
+        str: The sanitized name
+    """
+    sanitized = PATH_EDGE_TRIM_RE.sub('', name.translate(INVALID_PATH_CHARS))
+    if RESERVED_PATH_NAME_RE.match(sanitized):
+        sanitized = '_' + sanitized
+    if len(sanitized) > MAX_PATH_COMPONENT_LENGTH:
+        sanitized = PATH_EDGE_TRIM_RE.sub('', sanitized[:MAX_PATH_COMPONENT_LENGTH])
+    return sanitized or fallback
+
+@lru_cache(maxsize=32)
+def numbered_choices(count, *extra):
+    """Build the list of valid answers for a numbered prompt.
+    
+    Args:
+        count: Number of numbered options (1..count)
+        *extra: Additional accepted answers such as "C"/"c" to cancel
+        
+    Returns:
+        list: ["1", ..., str(count), *extra] - shared between calls, do not mutate
+    """
+    return [str(i) for i in range(1, count + 1)] + list(extra)
+
 def start_size_monitor():
     """Start a background thread to periodically monitor terminal size changes.
     This is used as a fallback for environments where signal handlers don't work.
@@ -499,8 +676,11 @@ def start_size_monitor():
 class SpotifyBurner:
     def __init__(self):
         """Initialize the SpotifyBurner application."""
+        init_runtime()
         self.spotify = None
         self.config = self.load_config()
+        # Last configuration read from or written to disk, to skip no-op saves
+        self._saved_config = copy.deepcopy(self.config)
         self.download_dir = self.config.get("download_dir", DEFAULT_OUTPUT_DIR)
         self.dvd_drive = self.config.get("dvd_drive", None)
         self.max_threads = self.config.get("max_threads", 3)
@@ -517,14 +697,22 @@ class SpotifyBurner:
         }
         user_burn = self.config.get("burn_settings", {}) or {}
         self.burn_settings = {**defaults, **user_burn}
-        self.metadata_settings = self.config.get("metadata_settings", {
+        metadata_defaults = {
             "save_album_art": True,
             "embed_lyrics": False,
             "overwrite_metadata": True
-        })
+        }
+        user_metadata = self.config.get("metadata_settings", {}) or {}
+        self.metadata_settings = {**metadata_defaults, **user_metadata}
         self.download_queue = queue.Queue()
         self.download_threads = []
         self.stop_threads = False
+        # Cached main menu table as ((theme, is_wide), Table)
+        self._menu_table_cache = None
+        # Cached header renderables as ((theme, width, height), [renderables])
+        self._header_cache = None
+        # Fetched track listings as (type, id) -> (fetched_at, items)
+        self._track_list_cache = {}
         app_state["max_concurrent_downloads"] = self.max_threads
         
         # Set up the download thread pool
@@ -585,8 +773,13 @@ class SpotifyBurner:
         """Load configuration from config file or create default."""
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    return json.load(f)
+                with open(CONFIG_FILE, 'rb') as f:
+                    data = f.read()
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+                if not isinstance(config, dict):
+                    raise json.JSONDecodeError("Expected a JSON object", "", 0)
+                return config
             except json.JSONDecodeError:
                 logger.error("Config file is corrupted. Using defaults.")
                 console.print("[bold red]Error: Config file is corrupted. Using defaults.[/bold red]")
@@ -607,10 +800,19 @@ class SpotifyBurner:
             "metadata_settings": self.metadata_settings
         }
         
+        if config == self._saved_config:
+            logger.debug("Configuration unchanged, not saving.")
+            return
+        
         try:
             os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-            with open(CONFIG_FILE, 'w') as f:
+            # Write to a temporary file and swap it in so an interrupted save
+            # never leaves a truncated config behind
+            tmp_path = CONFIG_FILE + ".tmp"
+            with open(tmp_path, 'w') as f:
                 json.dump(config, f, indent=4)
+            os.replace(tmp_path, CONFIG_FILE)
+            self._saved_config = copy.deepcopy(config)
             logger.info("Configuration saved successfully.")
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
@@ -624,75 +826,11 @@ class SpotifyBurner:
         Args:
             theme_name: Name of the theme to apply (default, dark, light, modern, neon, spotify)
         """
-        # Theme definitions
-        themes = {
-            "default": {
-                "main_color": "cyan",
-                "accent_color": "green", 
-                "warning_color": "yellow",
-                "error_color": "red",
-                "success_color": "green",
-                "header_style": "bold blue",
-                "border_style": "cyan",
-                "box_type": box.ROUNDED
-            },
-            "dark": {
-                "main_color": "blue", 
-                "accent_color": "cyan",
-                "warning_color": "yellow",
-                "error_color": "red",
-                "success_color": "green",
-                "header_style": "bold cyan",
-                "border_style": "blue",
-                "box_type": box.HEAVY
-            },
-            "light": {
-                "main_color": "magenta",
-                "accent_color": "blue",
-                "warning_color": "orange3",
-                "error_color": "red",
-                "success_color": "green",
-                "header_style": "bold magenta",
-                "border_style": "magenta",
-                "box_type": box.SQUARE
-            },
-            "modern": {
-                "main_color": "bright_blue",
-                "accent_color": "bright_cyan",
-                "warning_color": "gold1",
-                "error_color": "bright_red",
-                "success_color": "bright_green",
-                "header_style": "bold bright_blue",
-                "border_style": "bright_blue",
-                "box_type": box.ROUNDED
-            },
-            "neon": {
-                "main_color": "hot_pink",
-                "accent_color": "bright_cyan",
-                "warning_color": "bright_yellow",
-                "error_color": "bright_red",
-                "success_color": "bright_green",
-                "header_style": "bold hot_pink",
-                "border_style": "purple",
-                "box_type": box.DOUBLE
-            },
-            "spotify": {
-                "main_color": "green4",
-                "accent_color": "green1",
-                "warning_color": "yellow",
-                "error_color": "red",
-                "success_color": "green",
-                "header_style": "bold green",
-                "border_style": "green",
-                "box_type": box.ROUNDED
-            }
-        }
-        
         # Set the theme - if not found, use default
-        if theme_name not in themes:
+        if theme_name not in THEMES:
             theme_name = "default"
             
-        theme = themes[theme_name]
+        theme = THEMES[theme_name]
             
         # Store the theme colors in the app state for easy access
         app_state["theme"] = {
@@ -736,14 +874,30 @@ class SpotifyBurner:
                 console.print("[green]Credentials saved to .env file[/green]")
         
         try:
+            os.makedirs(APP_DATA_DIR, exist_ok=True)
             client_credentials_manager = SpotifyClientCredentials(
-                client_id=client_id, client_secret=client_secret
+                client_id=client_id,
+                client_secret=client_secret,
+                cache_handler=CacheFileHandler(cache_path=SPOTIFY_TOKEN_CACHE_PATH)
+            )
+            # Validate the credentials; a still-valid cached token is reused
+            # without touching the network
+            client_credentials_manager.get_access_token(as_dict=False)
+            # Let spotipy's urllib3 retry policy absorb 429/5xx responses; it honors
+            # the Retry-After header and backs off exponentially between attempts
+            self.spotify = spotipy.Spotify(
+                client_credentials_manager=client_credentials_manager,
+                retries=SPOTIFY_API_RETRIES,
+                status_retries=SPOTIFY_API_RETRIES,
+                backoff_factor=SPOTIFY_API_BACKOFF_FACTOR
             )
-            self.spotify = spotipy.Spotify(client_credentials_manager=client_credentials_manager)
-            # Test the connection
-            self.spotify.search("test", limit=1)
             logger.info("Spotify API connection successful")
             return True
+        except SpotifyOauthError as e:
+            logger.error(f"Spotify API authentication failed: {e}")
+            console.print(f"[bold red]Spotify API authentication failed: {e}[/bold red]")
+            console.print("[yellow]Check SPOTIPY_CLIENT_ID and SPOTIPY_CLIENT_SECRET.[/yellow]")
+            return False
         except spotipy.SpotifyException as e:
             logger.error(f"Error connecting to Spotify API: {e}")
             console.print(f"[bold red]Error connecting to Spotify API: {e}[/bold red]")
@@ -774,28 +928,41 @@ class SpotifyBurner:
             albums = []
             tracks = []
             playlists = []
-              # Determine which types to search based on search_type
-            if search_type == 'song' or search_type is None:
+            # Determine which types to search based on search_type
+            wanted_types = [
+                kind for kind, key in (("track", "song"), ("album", "album"), ("playlist", "playlist"))
+                if search_type == key or search_type is None
+            ]
+            
+            # Issue the searches concurrently - each one is an independent API round-trip
+            self._prefetch_spotify_token()
+            with ThreadPoolExecutor(max_workers=SPOTIFY_MAX_CONCURRENT_REQUESTS) as search_pool:
+                pending = {
+                    kind: search_pool.submit(self.spotify.search, q=query, type=kind, limit=10)
+                    for kind in wanted_types
+                }
+            
+            if "track" in pending:
                 try:
-                    tracks_result = self.spotify.search(query, type="track", limit=10)
+                    tracks_result = pending["track"].result()
                     tracks = tracks_result.get("tracks", {}).get("items", []) if tracks_result else []
                 except Exception as e:
                     logger.error(f"Error searching for tracks: {e}")
                     console.print(f"[yellow]Error searching for tracks: {e}[/yellow]")
                     tracks = []
                 
-            if search_type == 'album' or search_type is None:
+            if "album" in pending:
                 try:
-                    albums_result = self.spotify.search(query, type="album", limit=10)
+                    albums_result = pending["album"].result()
                     albums = albums_result.get("albums", {}).get("items", []) if albums_result else []
                 except Exception as e:
                     logger.error(f"Error searching for albums: {e}")
                     console.print(f"[yellow]Error searching for albums: {e}[/yellow]")
                     albums = []
             
-            if search_type == 'playlist' or search_type is None:
+            if "playlist" in pending:
                 try:
-                    playlists_result = self.spotify.search(q=query, type='playlist', limit=10)
+                    playlists_result = pending["playlist"].result()
                     if playlists_result:
                         playlists_data = playlists_result.get('playlists') # Safely get 'playlists' dictionary
                         if playlists_data and isinstance(playlists_data, dict): # Check it's a dict
@@ -886,7 +1053,7 @@ class SpotifyBurner:
             input_message = f"Enter selection number [1-{total_items}], or 'C' to cancel"
             
             while True:
-                choice = Prompt.ask(input_message, choices=[str(i) for i in range(1, total_items + 1)] + ["C", "c"])
+                choice = Prompt.ask(input_message, choices=numbered_choices(total_items, "C", "c"))
                 
                 if choice.upper() == "C":
                     return None
@@ -926,6 +1093,12 @@ class SpotifyBurner:
 
     def search_and_download(self):
         """Search for and download music from Spotify."""
+        # The API client is only needed here, so the menu, library and
+        # settings screens never wait on (or prompt for) Spotify credentials
+        if self.spotify is None and not self.initialize_spotify():
+            self.wait_for_keypress()
+            return
+        
         self.clear_screen()
         
         # Show search header
@@ -997,11 +1170,7 @@ class SpotifyBurner:
 
 
         # Sanitize the base folder name
-        sane_folder_name = re.sub(r'[<>:\"/\\\\|?*]', '_', base_folder_name)  # Invalid path chars
-        sane_folder_name = re.sub(r'[\\.\\s]+$', '', sane_folder_name) # trailing dots/spaces
-        sane_folder_name = re.sub(r'^[\\.\\s]+', '', sane_folder_name) # leading dots/spaces
-        if not sane_folder_name:
-            sane_folder_name = "Sanitized_Downloaded_Tracks"
+        sane_folder_name = sanitize_path_component(base_folder_name, "Sanitized_Downloaded_Tracks")
             
         current_output_dir = os.path.join(self.download_dir, sane_folder_name)
         
@@ -1012,9 +1181,6 @@ class SpotifyBurner:
             self.wait_for_keypress()
             return
         
-        # Enhance metadata
-        self.enhance_download_metadata(selection, current_output_dir)
-        
         # Ask about burning
         if Confirm.ask("\nDo you want to burn these tracks to CD/DVD?"):
             self.burn_to_disc(current_output_dir, self.dvd_drive)
@@ -1056,8 +1222,13 @@ class SpotifyBurner:
             
             # Get album tracks
             try:
-                album_tracks = self.spotify.album_tracks(album_id)
-                tracks = album_tracks["items"] if "items" in album_tracks else []
+                tracks = self._get_cached_tracks(
+                    "album", album_id,
+                    lambda: self._fetch_all_pages(
+                        lambda offset: self.spotify.album_tracks(album_id, limit=50, offset=offset),
+                        self.spotify.album_tracks(album_id, limit=50)
+                    )
+                )
                 
                 if not tracks:
                     console.print("[yellow]No tracks found in this album.[/yellow]")
@@ -1126,28 +1297,13 @@ class SpotifyBurner:
             
             # Get playlist tracks
             try:
-                # Playlists can be large, so we might need to paginate
-                tracks = []
-                results = self.spotify.playlist_tracks(playlist_id)
-                
-                if not results:
-                    logger.error("Received empty results when fetching playlist tracks")
+                tracks = self._get_cached_tracks(
+                    "playlist", playlist_id,
+                    lambda: self._fetch_playlist_tracks(playlist_id)
+                )
+                if tracks is None:
                     console.print("[yellow]Error: Could not retrieve playlist tracks[/yellow]")
                     return []
-                    
-                # Use get() with default to avoid KeyError
-                playlist_items = results.get('items', [])
-                if playlist_items:
-                    tracks.extend(playlist_items)
-                
-                # Handle pagination if next page exists
-                while results.get('next'):
-                    results = self.spotify.next(results)
-                    if not results:
-                        break
-                    next_items = results.get('items', [])
-                    if next_items:
-                        tracks.extend(next_items)
                 
                 if not tracks:
                     console.print("[yellow]No tracks found in this playlist.[/yellow]")
@@ -1215,27 +1371,90 @@ class SpotifyBurner:
             
         return []
 
-    def enhance_download_metadata(self, selection, output_dir):
-        """Enhance downloaded music metadata.
+    def _get_cached_tracks(self, item_type, item_id, fetch):
+        """Return a track listing, reusing a recent fetch of the same item.
         
         Args:
-            selection: Dictionary containing album or track info
-            output_dir: Directory containing downloaded music
-        """
-        if not selection or not output_dir:
-            return
+            item_type: 'album' or 'playlist'
+            item_id: Spotify ID of the album or playlist
+            fetch: Callable returning the list of track items
             
-        console.print("\n[bold cyan]Enhancing metadata...[/bold cyan]")
+        Returns:
+            list: Track items, or None if the fetch returned nothing
+        """
+        key = (item_type, item_id)
+        now = time.monotonic()
+        cached = self._track_list_cache.get(key)
+        if cached and now - cached[0] < SPOTIFY_TRACK_CACHE_TTL:
+            return cached[1]
+        
+        tracks = fetch()
+        if tracks is not None:
+            self._track_list_cache[key] = (now, tracks)
+        return tracks
+
+    def _fetch_playlist_tracks(self, playlist_id):
+        """Fetch every item of a playlist.
         
-        try:
-            # TODO: Additional metadata enhancement could be implemented here
-            # - Fix tags
+        Args:
+            playlist_id: Spotify playlist ID
             
-            console.print("[green]Metadata enhancement completed[/green]")
+        Returns:
+            list: Playlist items, or None if Spotify returned nothing
+        """
+        # Playlists can be large, so we might need to paginate
+        results = self.spotify.playlist_tracks(playlist_id, fields=SPOTIFY_PLAYLIST_TRACK_FIELDS)
+        if not results:
+            logger.error("Received empty results when fetching playlist tracks")
+            return None
+        
+        return self._fetch_all_pages(
+            lambda offset: self.spotify.playlist_tracks(
+                playlist_id, fields=SPOTIFY_PLAYLIST_TRACK_FIELDS, offset=offset
+            ),
+            results
+        )
+
+    def _prefetch_spotify_token(self):
+        """Make sure a fresh access token is cached before fanning out requests.
+        
+        The single spotipy client is shared by the search and pagination
+        worker threads. That is safe for independent GET requests: the
+        client keeps no per-request state and its requests session hands
+        each thread its own pooled connection. The one shared write is the
+        token refresh, which also rewrites the cache file, so it is done
+        here on the calling thread. Workers then only read the cached
+        token, which spotipy treats as valid for at least another minute.
+        """
+        self.spotify.auth_manager.get_access_token(as_dict=False)
+
+    def _fetch_all_pages(self, fetch_page, first_page):
+        """Collect the items from every page of a Spotify paging object.
+        
+        The first page reports the total, so the remaining offsets are
+        requested concurrently instead of following 'next' links one
+        round-trip at a time.
+        
+        Args:
+            fetch_page: Callable taking an offset and returning a paging object
+            first_page: The already fetched first paging object
             
-        except Exception as e:
-            logger.error(f"Error enhancing metadata: {e}")
-            console.print(f"[yellow]Error enhancing metadata: {e}[/yellow]")
+        Returns:
+            list: Items from all pages, in order
+        """
+        items = list(first_page.get("items") or [])
+        limit = first_page.get("limit") or len(items)
+        total = first_page.get("total") or 0
+        if not limit or total <= first_page.get("offset", 0) + limit:
+            return items
+        
+        offsets = range(first_page.get("offset", 0) + limit, total, limit)
+        self._prefetch_spotify_token()
+        with ThreadPoolExecutor(max_workers=SPOTIFY_MAX_CONCURRENT_REQUESTS) as page_pool:
+            for page in page_pool.map(fetch_page, offsets):
+                if page:
+                    items.extend(page.get("items") or [])
+        return items
 
     def play_album(self, album_path):
         """Play an album with the default system player.
@@ -1292,50 +1511,17 @@ class SpotifyBurner:
         
         # Try using CDBurnerXP's --list-drives command to get drive information
         try:
-            # First check for environment variable (set by batch file)
-            env_path = os.environ.get("CDBURNERXP_PATH")
-            # Then check burn settings, then fall back to default if not set
-            default_exe = ".\\CDBurnerXP\\cdbxpcmd.exe"
-            cdburnerxp_path = env_path or self.burn_settings.get("cdburnerxp_path") or default_exe
+            cdburnerxp_path = self._get_cdburnerxp_path()
             
             if os.path.exists(cdburnerxp_path):
                 logger.info(f"Using CDBurnerXP at {cdburnerxp_path} to detect drives")
                 console.print(f"[cyan]Detecting optical drives with CDBurnerXP...[/cyan]")
                 
-                # Run the command to list drives
-                process = subprocess.run([cdburnerxp_path, "--list-drives"], 
-                                        capture_output=True, text=True)
-                
-                if process.returncode == 0:
-                    # Process successful output
-                    output = process.stdout
-                    lines = output.strip().split('\n')
-                              # Parse the output to get drive numbers and letters
-                    for line in lines:
-                        # Handle formats like "0: DVD RW (H:\)" or "0: Drive D:\"
-                        if ':' in line:
-                            parts = line.split(':', 1)
-                            drive_number = parts[0].strip()
-                            
-                            # Extract drive letter from parentheses like (H:\) or from format like "Drive D:\"
-                            if '(' in line and ')' in line:
-                                drive_letter = line.split('(')[1].split(')')[0].replace(':\\', '')
-                                drives[drive_letter] = drive_number
-                            else:
-                                match = re.search(r'Drive\s+([A-Z]):.*', parts[1])
-                                if match:
-                                    drive_letter = match.group(1)
-                                    drives[drive_letter] = drive_number
-                            
-                            if drive_letter in drives:
-                                logger.info(f"Found optical drive: {drive_letter}: (drive number {drive_number})")
-                    
-                    if drives:
-                        return drives
-                    else:
-                        logger.warning("No drives found with CDBurnerXP --list-drives")
+                drives = self._list_cdburnerxp_drives(cdburnerxp_path)
+                if drives:
+                    return drives
                 else:
-                    logger.warning(f"CDBurnerXP --list-drives returned error code {process.returncode}")
+                    logger.warning("No drives found with CDBurnerXP --list-drives")
         except Exception as e:
             logger.error(f"Error using CDBurnerXP to detect drives: {e}")
         
@@ -1408,9 +1594,6 @@ class SpotifyBurner:
         
         # Windows-specific code to detect optical drives
         if sys.platform == "win32" or sys.platform == "win64":
-            # Import ctypes within the method to avoid import issues on non-Windows platforms
-            import ctypes
-            
             for drive in range(ord('A'), ord('Z')+1):
                 drive_letter = chr(drive) + ':'
                 try:
@@ -1425,6 +1608,50 @@ class SpotifyBurner:
                     
         return drives
 
+    def _get_cdburnerxp_path(self):
+        """Resolve the CDBurnerXP command-line executable path.
+        
+        The CDBURNERXP_PATH environment variable (set by the launcher batch
+        file) wins over the configured burn setting, which wins over the
+        bundled default location.
+        
+        Returns:
+            str: Path to cdbxpcmd.exe (not checked for existence)
+        """
+        env_path = os.environ.get("CDBURNERXP_PATH")
+        default_exe = ".\\CDBurnerXP\\cdbxpcmd.exe"
+        return env_path or self.burn_settings.get("cdburnerxp_path") or default_exe
+
+    def _list_cdburnerxp_drives(self, cdburnerxp_path):
+        """Run CDBurnerXP --list-drives and parse the drive list.
+        
+        Handles both "0: DVD RW (H:\\)" and "0: Drive D:\\" output formats.
+        
+        Args:
+            cdburnerxp_path: Path to cdbxpcmd.exe
+            
+        Returns:
+            dict: Mapping of drive letter (e.g. "H") to CDBurnerXP drive number
+        """
+        process = subprocess.run([cdburnerxp_path, "--list-drives"],
+                                 capture_output=True, text=True)
+        if process.returncode != 0:
+            logger.warning(f"CDBurnerXP --list-drives returned error code {process.returncode}: "
+                           f"{process.stderr.strip()}")
+            return {}
+        
+        drives = {}
+        for line in process.stdout.strip().splitlines():
+            if ':' not in line:
+                continue
+            drive_number, drive_info = line.split(':', 1)
+            match = CDBURNERXP_DRIVE_RE.search(drive_info)
+            if match:
+                drive_letter = match.group(1) or match.group(2)
+                drives[drive_letter] = drive_number.strip()
+                logger.info(f"Found optical drive: {drive_letter}: (drive number {drives[drive_letter]})")
+        return drives
+
     def burn_to_disc(self, source_dir, drive=None):
         """Burn files to CD/DVD using CDBurnerXP command-line.
         
@@ -1446,12 +1673,8 @@ class SpotifyBurner:
             # For non-Windows, we have to use manual instructions
             self.show_manual_burn_instructions(source_dir)
             return False
-          # Use CDBurnerXP command-line for burning
-        # First check for environment variable (set by batch file)
-        env_path = os.environ.get("CDBURNERXP_PATH")
-        # Then check burn settings, then fall back to default if not set
-        default_exe = ".\\CDBurnerXP\\cdbxpcmd.exe"
-        cdburnerxp_path = env_path or self.burn_settings.get("cdburnerxp_path") or default_exe
+        # Use CDBurnerXP command-line for burning
+        cdburnerxp_path = self._get_cdburnerxp_path()
         if not os.path.exists(cdburnerxp_path):
             logger.error(f"CDBurnerXP not found at {cdburnerxp_path}")
             console.print(f"[bold red]Error: CDBurnerXP not found at {cdburnerxp_path}[/bold red]")
@@ -1465,42 +1688,16 @@ class SpotifyBurner:
                 disc_label = dir_name.split(' - ', 1)[1]
             else:
                 disc_label = dir_name or f"SpotifyMusic_{time.strftime('%Y%m%d')}"
-            disc_label = re.sub(r'[^\w\s-]', '', disc_label).strip()
+            disc_label = DISC_LABEL_INVALID_RE.sub('', disc_label).strip()
             disc_label = disc_label[:16] if len(disc_label) > 16 else disc_label            # First, get a list of available drives directly from CDBurnerXP
             console.print("[cyan]Getting list of available drives from CDBurnerXP...[/cyan]")
             try:
-                # Run the --list-drives command to get available drives
-                drives_cmd = f'"{cdburnerxp_path}" --list-drives'
-                logger.info(f"Executing drive detection command: {drives_cmd}")
-                drives_result = subprocess.run(drives_cmd, capture_output=True, text=True, shell=True)
-                
-                # Parse the output to get drive numbers and their corresponding letters
-                drive_mapping = {}
-                if drives_result.returncode == 0:
-                    drive_output = drives_result.stdout.strip()
-                    console.print(f"[dim]Available drives: \n{drive_output}[/dim]")
-                    
-                    # Parse output like "0: DVD RW (H:\)" to extract drive number and letter
-                    for line in drive_output.split('\n'):
-                        if ':' in line:
-                            try:
-                                parts = line.split(':', 1)
-                                drive_num = parts[0].strip()
-                                # Extract drive letter from parentheses like (H:\)
-                                if '(' in parts[1] and ')' in parts[1]:
-                                    drive_info = parts[1].strip()
-                                    drive_letter_match = re.search(r'\(([A-Z]):\\?\)', drive_info)
-                                    if drive_letter_match:
-                                        drive_letter = drive_letter_match.group(1)
-                                        drive_mapping[drive_letter] = drive_num
-                                        logger.info(f"Mapped drive {drive_letter}: to drive number {drive_num}")
-                            except Exception as parse_error:
-                                logger.error(f"Error parsing drive info '{line}': {parse_error}")
-                    
+                drive_mapping = self._list_cdburnerxp_drives(cdburnerxp_path)
+                if drive_mapping:
                     logger.info(f"Found optical drives: {drive_mapping}")
+                    console.print(f"[dim]Available drives: {drive_mapping}[/dim]")
                 else:
-                    logger.error(f"Error getting drive list: {drives_result.stderr}")
-                    console.print(f"[red]Error getting drive list: {drives_result.stderr}[/red]")
+                    console.print("[yellow]CDBurnerXP did not report any drives[/yellow]")
             except Exception as e:
                 logger.error(f"Exception getting drive list: {e}")
                 console.print(f"[red]Exception getting drive list: {e}[/red]")
@@ -1541,9 +1738,9 @@ class SpotifyBurner:
                 burn_folder = video_ts
             else:
                 # Check if folder contains only audio files
-                audio_exts = ('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac')
-                files = [f for f in os.listdir(source_dir) if os.path.isfile(os.path.join(source_dir, f))]
-                if files and all(f.lower().endswith(audio_exts) for f in files):
+                with os.scandir(source_dir) as entries:
+                    files = [entry.name for entry in entries if entry.is_file()]
+                if files and all(f.lower().endswith(BURN_AUDIO_EXTENSIONS) for f in files):
                     action = '--burn-audio'
                     burn_folder = source_dir
                 else:
@@ -1709,14 +1906,34 @@ class SpotifyBurner:
         # Update terminal dimensions
         check_terminal_size()
         
-        # Get theme-appropriate colors
-        header_style = app_state["theme"]["header"] if "theme" in app_state else "bold cyan"
-        main_color = app_state["theme"]["main"] if "theme" in app_state else "cyan"
-        accent_color = app_state["theme"]["accent"] if "theme" in app_state else "green"
-        
-        # Get current terminal dimensions
+        # The logo panels only depend on the theme and terminal size, so
+        # reuse them across screens until either changes
         width = app_state["terminal_size"]["width"]
         height = app_state["terminal_size"]["height"]
+        header_key = (self.theme, width, height)
+        if self._header_cache is None or self._header_cache[0] != header_key:
+            self._header_cache = (header_key, self._build_header(width, height))
+        
+        for renderable in self._header_cache[1]:
+            console.print(renderable)
+
+    def _build_header(self, width, height):
+        """Build the renderables that make up the application header.
+        
+        Args:
+            width: Terminal width in columns
+            height: Terminal height in rows
+            
+        Returns:
+            list: Rich renderables to print in order
+        """
+        renderables = []
+        
+        # Get theme-appropriate colors
+        theme = app_state.get("theme", {})
+        header_style = theme.get("header", "bold cyan")
+        main_color = theme.get("main", "cyan")
+        accent_color = theme.get("accent", "green")
         
         # For very small terminals, show compact header
         if width < MIN_TERMINAL_WIDTH - 20 or height < MIN_TERMINAL_HEIGHT - 5:
@@ -1733,11 +1950,11 @@ class SpotifyBurner:
                 width=width - 2,
             )
             
-            console.print(header)
-            return
+            renderables.append(header)
+            return renderables
             
         # For larger terminals, show full logo
-        if app_state["terminal_size"]["width"] >= MIN_TERMINAL_WIDTH:
+        if width >= MIN_TERMINAL_WIDTH:
             # Select header style based on theme
             if self.theme in ["modern", "spotify"]:
                 # Create a panel with modern theme logo
@@ -1762,7 +1979,7 @@ class SpotifyBurner:
                     title_align="center"
                 )
                 
-                console.print(header)
+                renderables.append(header)
                 
             elif self.theme == "neon":
                 # For neon theme, use panel with neon style
@@ -1787,7 +2004,7 @@ class SpotifyBurner:
                     title_align="center"
                 )
                 
-                console.print(header)
+                renderables.append(header)
                 
             else:
                 # For classic theme, use panel with standard style
@@ -1810,11 +2027,11 @@ class SpotifyBurner:
                     width=get_adaptive_width()
                 )
                 
-                console.print(header)
+                renderables.append(header)
         else:
             # For smaller terminals, show a simplified header
             simple_header = f"[{header_style}]SPOTIFY DOWNLOADER & BURNER v{VERSION}[/{header_style}]"
-            console.print(Panel(
+            renderables.append(Panel(
                 simple_header, 
                 border_style=header_style, 
                 box=box.ROUNDED,
@@ -1823,16 +2040,18 @@ class SpotifyBurner:
         
         # Add slogan with theme-specific formatting
         if self.theme == "neon":
-            console.print(f"[{accent_color} bold]🎵 Search, download, and burn your favorite music! 🎵[/{accent_color} bold]\n")
+            renderables.append(f"[{accent_color} bold]🎵 Search, download, and burn your favorite music! 🎵[/{accent_color} bold]\n")
         elif self.theme == "spotify":
-            console.print(Panel.fit(
+            renderables.append(Panel.fit(
                 f"[bold]Powered by Spotify API & SpotDL[/bold]", 
                 border_style=accent_color,
                 width=get_adaptive_width(),
                 padding=(0, 2)
             ))
         else:
-            console.print(f"[bold]Search, download, and burn your favorite music![/bold]\n")
+            renderables.append(f"[bold]Search, download, and burn your favorite music![/bold]\n")
+        
+        return renderables
 
     def show_main_menu(self):
         """Display the main menu and handle user input."""
@@ -1850,49 +2069,54 @@ class SpotifyBurner:
             self.show_header()
             
             # Get theme colors for consistent styling
-            main_color = app_state["theme"]["main"] if "theme" in app_state else "cyan"
-            accent_color = app_state["theme"]["accent"] if "theme" in app_state else "green"
-            box_style = app_state["theme"]["box"] if "theme" in app_state else box.ROUNDED
-            border_style = app_state["theme"]["border"] if "theme" in app_state else "cyan"
+            theme = app_state.get("theme", {})
+            main_color = theme.get("main", "cyan")
+            accent_color = theme.get("accent", "green")
+            box_style = theme.get("box", box.ROUNDED)
+            border_style = theme.get("border", "cyan")
             
             # Create styled menu panel with options table inside
             menu_title = "[bold]MAIN MENU[/bold]" if self.theme != "spotify" else "[bold]✨ MAIN MENU ✨[/bold]"
             
             # Determine appropriate column widths based on terminal size
             is_wide = app_state["terminal_size"]["width"] >= MIN_TERMINAL_WIDTH
-              # Create options table
-            table = Table(show_header=False, box=box_style, show_edge=False)
-            table.add_column("Key", style=main_color, justify="right", width=6 if is_wide else 3)
-            table.add_column("Icon", style="bright_white", justify="center", width=4 if is_wide else 2)
-            table.add_column("Option", style="white", max_width=80 if is_wide else 40)
-            
-            # Add menu options with icons
-            table.add_row(
-                f"[bold {main_color}][1][/bold {main_color}]",                "📁", 
-                f"[bold green]Manage Existing Albums[/bold green]\n  Play, burn or delete your downloaded albums"
-            )
-            table.add_row(
-                f"[bold {main_color}][2][/bold {main_color}]", 
-                "🔍", 
-                f"[bold {accent_color}]Search & Download[/bold {accent_color}]\n  Find and download new music from Spotify"
-            )
-            table.add_row(
-                f"[bold {main_color}][3][/bold {main_color}]", 
-                "🎬", 
-                f"[bold magenta]Video Management[/bold magenta]\n  Download and manage videos"
-            )
-            table.add_row(
-                f"[bold {main_color}][4][/bold {main_color}]", 
-                "⚙️", 
-                f"[bold yellow]Settings[/bold yellow]\n  Configure download and burning options"
-            )
-            table.add_row(
-                f"[bold {main_color}][5][/bold {main_color}]", 
-                "ℹ️", 
-                f"[bold blue]About / Help[/bold blue]"
-            )
+              # Reuse the options table unless the theme or layout width changed
+            menu_key = (self.theme, is_wide)
+            if self._menu_table_cache is None or self._menu_table_cache[0] != menu_key:
+                table = Table(show_header=False, box=box_style, show_edge=False)
+                table.add_column("Key", style=main_color, justify="right", width=6 if is_wide else 3)
+                table.add_column("Icon", style="bright_white", justify="center", width=4 if is_wide else 2)
+                table.add_column("Option", style="white", max_width=80 if is_wide else 40)
+                
+                # Add menu options with icons
+                table.add_row(
+                    f"[bold {main_color}][1][/bold {main_color}]",                "📁", 
+                    f"[bold green]Manage Existing Albums[/bold green]\n  Play, burn or delete your downloaded albums"
+                )
+                table.add_row(
+                    f"[bold {main_color}][2][/bold {main_color}]", 
+                    "🔍", 
+                    f"[bold {accent_color}]Search & Download[/bold {accent_color}]\n  Find and download new music from Spotify"
+                )
+                table.add_row(
+                    f"[bold {main_color}][3][/bold {main_color}]", 
+                    "🎬", 
+                    f"[bold magenta]Video Management[/bold magenta]\n  Download and manage videos"
+                )
+                table.add_row(
+                    f"[bold {main_color}][4][/bold {main_color}]", 
+                    "⚙️", 
+                    f"[bold yellow]Settings[/bold yellow]\n  Configure download and burning options"
+                )
+                table.add_row(
+                    f"[bold {main_color}][5][/bold {main_color}]", 
+                    "ℹ️", 
+                    f"[bold blue]About / Help[/bold blue]"
+                )
+                self._menu_table_cache = (menu_key, table)
+            
             # Display the menu table
-            console.print(table)
+            console.print(self._menu_table_cache[1])
             
             console.print()
             
@@ -1933,10 +2157,11 @@ class SpotifyBurner:
             albums = self.scan_existing_albums()
         
         # Get theme colors for consistent styling
-        main_color = app_state["theme"]["main"] if "theme" in app_state else "cyan"
-        accent_color = app_state["theme"]["accent"] if "theme" in app_state else "green"
-        border_style = app_state["theme"]["border"] if "theme" in app_state else "cyan"
-        box_style = app_state["theme"]["box"] if "theme" in app_state else box.ROUNDED
+        theme = app_state.get("theme", {})
+        main_color = theme.get("main", "cyan")
+        accent_color = theme.get("accent", "green")
+        border_style = theme.get("border", "cyan")
+        box_style = theme.get("box", box.ROUNDED)
         
         if not albums:
             console.print(Panel(
@@ -1982,11 +2207,6 @@ class SpotifyBurner:
             
             console.print(table)
             
-            # Get theme colors for options menu
-            main_color = app_state["theme"]["main"] if "theme" in app_state else "cyan"
-            accent_color = app_state["theme"]["accent"] if "theme" in app_state else "green"
-            border_style = app_state["theme"]["border"] if "theme" in app_state else "cyan"
-            
             # Create an options menu with icons
             options_table = Table(show_header=False, box=box.SIMPLE, show_edge=False)
             options_table.add_column("Key", style=main_color, justify="right", width=3)
@@ -2069,29 +2289,37 @@ class SpotifyBurner:
         
         try:
             # Walk through the download directory to find all subdirectories (albums)
-            subdirs = [d for d in os.listdir(self.download_dir) 
-                      if os.path.isdir(os.path.join(self.download_dir, d))]
+            with os.scandir(self.download_dir) as entries:
+                subdirs = [entry for entry in entries if entry.is_dir()]
             
             if not subdirs:
                 console.print("[yellow]No existing albums found.[yellow]")
                 return []
                 
             # Process each subdirectory as a potential album
-            for album_dir in subdirs:
-                album_path = os.path.join(self.download_dir, album_dir)
-                
-                # Count the number of audio files in the directory
-                audio_files = [f for f in os.listdir(album_path) 
-                              if f.lower().endswith(('.mp3', '.flac', '.ogg', '.m4a', '.wav'))]
-                
-                if not audio_files:
+            for album_entry in subdirs:
+                album_dir = album_entry.name
+                album_path = album_entry.path
+                
+                # Single directory pass: count audio files and total up file sizes
+                audio_count = 0
+                total_size = 0
+                with os.scandir(album_path) as files:
+                    for file_entry in files:
+                        if not file_entry.is_file():
+                            continue
+                        total_size += file_entry.stat().st_size
+                        if file_entry.name.lower().endswith(LIBRARY_AUDIO_EXTENSIONS):
+                            audio_count += 1
+                
+                if not audio_count:
                     continue  # Skip directories without audio files
                 
                 # Get the creation date of the directory
                 try:
-                    created_date = time.strftime('%Y-%m-%d', 
-                                                time.localtime(os.path.getctime(album_path)))
-                except:
+                    created_date = time.strftime('%Y-%m-%d',
+                                                time.localtime(album_entry.stat().st_ctime))
+                except OSError:
                     created_date = "Unknown"
                 
                 # Attempt to extract artist name and album name from directory name
@@ -2103,11 +2331,6 @@ class SpotifyBurner:
                     artist = "Unknown"
                     title = album_dir
                 
-                # Calculate total size
-                total_size = sum(os.path.getsize(os.path.join(album_path, f)) 
-                                for f in os.listdir(album_path) 
-                                if os.path.isfile(os.path.join(album_path, f)))
-                
                 # Convert to MB with 2 decimal places
                 size_mb = round(total_size / (1024 * 1024), 2)
                 
@@ -2115,7 +2338,7 @@ class SpotifyBurner:
                     'name': title,
                     'artist': artist,
                     'path': album_path,
-                    'tracks': len(audio_files),
+                    'tracks': audio_count,
                     'date': created_date,
                     'size': size_mb
                 })
@@ -2147,7 +2370,8 @@ class SpotifyBurner:
             return
             
         # Get theme color for consistent styling
-        accent_color = app_state["theme"]["accent"] if "theme" in app_state else "green"
+        theme = app_state.get("theme", {})
+        accent_color = theme.get("accent", "green")
         
         # Use animated spinner for a more modern look
         with Progress(
@@ -2170,21 +2394,20 @@ class SpotifyBurner:
     def prompt_for_album_number(self, albums):
         """Prompt user to select an album number."""
         while True:
-            try:
-                # Show cursor for input
-                self.show_cursor()
-                album_num = int(Prompt.ask(f"Enter album number [1-{len(albums)}]"))
-                # Hide cursor after input
-                self.hide_cursor()
-                
-                if 1 <= album_num <= len(albums):
-                    return album_num
-                else:
-                    console.print(f"[red]Please enter a number between 1 and {len(albums)}[/red]")
-            except ValueError:
+            # Show cursor for input
+            self.show_cursor()
+            input_str = Prompt.ask(f"Enter album number [1-{len(albums)}]").strip()
+            # Hide cursor after input
+            self.hide_cursor()
+            
+            if not input_str.isdecimal():
                 console.print("[red]Please enter a valid number[/red]")
-                # Ensure cursor is hidden after error
-                self.hide_cursor()
+                continue
+            
+            album_num = int(input_str)
+            if 1 <= album_num <= len(albums):
+                return album_num
+            console.print(f"[red]Please enter a number between 1 and {len(albums)}[/red]")
 
     def prompt_for_album_numbers(self, albums):
         """Prompt user to select one or multiple album numbers."""
@@ -2195,14 +2418,15 @@ class SpotifyBurner:
             # Hide cursor after input
             self.hide_cursor()
             
-            try:
-                nums = [int(x.strip()) for x in input_str.split(',')]
-                if all(1 <= n <= len(albums) for n in nums):
-                    return list(dict.fromkeys(nums))
-                else:
-                    console.print(f"[red]Numbers must be between 1 and {len(albums)}[/red]")
-            except ValueError:
+            parts = [x.strip() for x in input_str.split(',')]
+            if not all(part.isdecimal() for part in parts):
                 console.print("[red]Please enter valid numbers separated by commas[/red]")
+                continue
+            
+            nums = [int(part) for part in parts]
+            if all(1 <= n <= len(albums) for n in nums):
+                return list(dict.fromkeys(nums))
+            console.print(f"[red]Numbers must be between 1 and {len(albums)}[/red]")
 
     def prompt_for_video_urls(self):
         """Prompt user to enter one or multiple video URLs separated by commas."""
@@ -2216,12 +2440,10 @@ class SpotifyBurner:
         console.print("[2] Video only")
         console.print("[3] Both")
         choice = Prompt.ask("Select type filter", choices=["1","2","3"], default="3")
-        audio_ext = ['.m4a', '.mp3', '.opus']
-        video_ext = ['.mp4', '.mkv', '.webm', '.avi', '.mov', '.flv']
         if choice == '1':
-            videos = [v for v in videos if os.path.splitext(v['name'])[1].lower() in audio_ext]
+            videos = [v for v in videos if os.path.splitext(v['name'])[1].lower() in VIDEO_AUDIO_EXTENSIONS]
         elif choice == '2':
-            videos = [v for v in videos if os.path.splitext(v['name'])[1].lower() in video_ext]
+            videos = [v for v in videos if os.path.splitext(v['name'])[1].lower() in VIDEO_EXTENSIONS]
         return videos
 
     def filter_videos_by_extension(self, videos):
@@ -2243,14 +2465,13 @@ class SpotifyBurner:
         for v in videos:
             name = v['name']
             # resolution patterns
-            m = re.search(r'(\d{3,4}x\d{3,4})', name)
+            m = VIDEO_DIMENSIONS_RE.search(name)
             if m:
                 resos.add(m.group(1))
             # '360p' style
-            for m2 in re.findall(r'(\d{3,4}p)', name):
-                resos.add(m2)
+            resos.update(VIDEO_PROGRESSIVE_RE.findall(name))
             # fps patterns
-            m3 = re.search(r'(\d{2,3})fps', name)
+            m3 = VIDEO_FPS_RE.search(name)
             if m3:
                 fps_set.add(m3.group(1))
         # filter by resolution
@@ -2294,9 +2515,9 @@ class SpotifyBurner:
         resos = set(); fps_set = set()
         for _,desc in formats:
             # resolution patterns
-            m = re.search(r'(\d{3,4}x\d{3,4}|\d{3,4}p)', desc)
+            m = VIDEO_RESOLUTION_RE.search(desc)
             if m: resos.add(m.group(1))
-            m2 = re.search(r'(\d{2,3})fps', desc)
+            m2 = VIDEO_FPS_RE.search(desc)
             if m2: fps_set.add(m2.group(1))
         if resos:
             console.print("\n[bold]Resolution filter:[/bold] "+ ", ".join(sorted(resos)) + ", All")
@@ -2357,11 +2578,11 @@ class SpotifyBurner:
         if not os.path.exists(videos_dir):
             return []
         items = []
-        for f in os.listdir(videos_dir):
-            full = os.path.join(videos_dir, f)
-            if os.path.isfile(full) and f.lower().endswith(('.mp4', '.mkv', '.webm', '.avi', '.mov', '.flv')):
-                size_mb = round(os.path.getsize(full) / (1024 * 1024), 2)
-                items.append({'name': f, 'path': full, 'size': size_mb})
+        with os.scandir(videos_dir) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(VIDEO_EXTENSIONS) and entry.is_file():
+                    size_mb = round(entry.stat().st_size / (1024 * 1024), 2)
+                    items.append({'name': entry.name, 'path': entry.path, 'size': size_mb})
         return items
 
     def play_video(self, video_path):
@@ -2451,13 +2672,16 @@ class SpotifyBurner:
 
     def manage_settings(self):
         """Manage application settings including CDBurnerXP options."""
+        # Only settings 1-9 are saved on exit; theme changes save immediately
+        settings_changed = False
         while True:
             self.clear_screen()
             self.show_header()
             
             # Get themed box and styling
-            box_style = app_state["theme"]["box"] if "theme" in app_state else box.ROUNDED
-            border_style = app_state["theme"]["border"] if "theme" in app_state else "cyan"
+            theme = app_state.get("theme", {})
+            box_style = theme.get("box", box.ROUNDED)
+            border_style = theme.get("border", "cyan")
             
             # Create a more visually appealing settings table
             table = Table(
@@ -2501,11 +2725,15 @@ class SpotifyBurner:
             
             choice = Prompt.ask(
                 "Select setting to change ([bold]B[/bold] to go back)",
-                choices=[str(i) for i in range(1,11)] + ["B","b"], 
+                choices=numbered_choices(10, "B", "b"), 
                 default="B"
             ).upper()
+            if choice not in ("B", "10"):
+                settings_changed = True
+            
             if choice == "B":
-                self.save_config()
+                if settings_changed:
+                    self.save_config()
                 break
             elif choice == "1":
                 self.download_dir = Prompt.ask("Enter download directory", default=self.download_dir)
@@ -2554,28 +2782,14 @@ class SpotifyBurner:
                 # Let user select a theme
                 theme_choice = Prompt.ask(
                     "Select a theme",
-                    choices=["1", "2", "3", "4", "5", "6", "B", "b"],
+                    choices=numbered_choices(len(THEME_CHOICES), "B", "b"),
                     default="B"
                 ).upper()
                 
-                if theme_choice == "1":
-                    self.theme = "default"
-                    self.apply_theme("default")
-                elif theme_choice == "2":
-                    self.theme = "dark"
-                    self.apply_theme("dark")
-                elif theme_choice == "3":
-                    self.theme = "light"
-                    self.apply_theme("light")
-                elif theme_choice == "4":
-                    self.theme = "modern"
-                    self.apply_theme("modern")
-                elif theme_choice == "5":
-                    self.theme = "neon"
-                    self.apply_theme("neon")
-                elif theme_choice == "6":
-                    self.theme = "spotify"
-                    self.apply_theme("spotify")
+                new_theme = THEME_CHOICES.get(theme_choice)
+                if new_theme:
+                    self.theme = new_theme
+                    self.apply_theme(new_theme)
                 
                 # If not B (back), save the theme change
                 if theme_choice != "B":
@@ -2589,10 +2803,11 @@ class SpotifyBurner:
         self.show_header()
         
         # Get theme-specific colors
-        main_color = app_state["theme"]["main"] if "theme" in app_state else "cyan"
-        accent_color = app_state["theme"]["accent"] if "theme" in app_state else "green"
-        border_style = app_state["theme"]["border"] if "theme" in app_state else "cyan"
-        box_style = app_state["theme"]["box"] if "theme" in app_state else box.ROUNDED
+        theme = app_state.get("theme", {})
+        main_color = theme.get("main", "cyan")
+        accent_color = theme.get("accent", "green")
+        border_style = theme.get("border", "cyan")
+        box_style = theme.get("box", box.ROUNDED)
         
         # Create a layout for better organization
         layout = Layout()
@@ -2721,11 +2936,11 @@ class SpotifyBurner:
             # Check for interrupted downloads at startup
             self.check_for_interrupted_downloads()
             
-            # Initialize Spotify API
-            if not self.initialize_spotify():
-                return 1
-                
             if query:
+                # Initialize Spotify API
+                if not self.initialize_spotify():
+                    return 1
+                
                 # Direct mode with query - go straight to search
                 selection = self.search_music(query, search_type)
                 if not selection:
@@ -2748,16 +2963,13 @@ class SpotifyBurner:
                 if selection["type"] == "album":
                     album_name = selection["item"]["name"]
                     artist_name = selection["item"]["artists"][0]["name"]
-                    album_dir = f"{artist_name} - {album_name}"
+                    album_dir = sanitize_path_component(f"{artist_name} - {album_name}", "Downloaded Album")
                     output_dir = os.path.join(self.download_dir, album_dir)
                   # Download tracks
                 if not self.download_tracks(tracks, output_dir, album_url):
                     console.print("[red]Download failed or was incomplete! Check the error messages above for details.[/red]")
                     return 1
                 
-                # Enhance metadata
-                self.enhance_download_metadata(selection, output_dir)
-                
                 # Ask about burning
                 if Confirm.ask("\nDo you want to burn these tracks to CD/DVD?"):
                     if not self.burn_to_disc(output_dir, self.dvd_drive):
@@ -2797,13 +3009,17 @@ class SpotifyBurner:
         if not track_urls:
             console.print("[yellow]No tracks to download.[/yellow]")
             return False
+        
+        # Playlists can list the same track more than once; fetch each URL only once
+        unique_urls = list(dict.fromkeys(track_urls))
+        if len(unique_urls) < len(track_urls):
+            logger.info(f"Skipping {len(track_urls) - len(unique_urls)} duplicate track URLs")
+            track_urls = unique_urls
             
-        # Create output directory if it doesn't exist
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-        else:
-            output_dir = self.download_dir
-            os.makedirs(output_dir, exist_ok=True)
+        # Create the output directory once up front, before any worker threads
+        # start writing into it
+        output_dir = output_dir or self.download_dir
+        os.makedirs(output_dir, exist_ok=True)
         
         logger.info(f"Downloading {len(track_urls)} tracks to {output_dir}")
         console.print(f"\n[bold cyan]Downloading {len(track_urls)} tracks to:[/bold cyan]")
@@ -2991,7 +3207,6 @@ class SpotifyBurner:
         except Exception as e:
             logger.error(f"Error downloading tracks: {str(e)}")
             console.print(f"[bold red]Error downloading tracks: {str(e)}[/bold red]")  # Show traceback for better debugging
-            import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
             return False
             
@@ -3155,11 +3370,7 @@ class SpotifyBurner:
             return False
             
         # Scan for partially downloaded files (typically with .part or .tmp extension)
-        partial_files = []
-        for root, dirs, files in os.walk(self.download_dir):
-            for file in files:
-                if file.endswith(('.part', '.tmp')):
-                    partial_files.append(os.path.join(root, file))
+        partial_files = self._find_partial_files(self.download_dir)
                     
         if not partial_files:
             return False
@@ -3177,61 +3388,116 @@ class SpotifyBurner:
             ) as progress:
                 task = progress.add_task("[cyan]Resuming downloads...", total=len(partial_files))
                 
-                for file_path in partial_files:
-                    try:
-                        # Extract the original filename from the partial file
-                        original_name = file_path.replace('.part', '').replace('.tmp', '')
-                        dir_path = os.path.dirname(file_path)
-                        
-                        # Build spotdl command with resume flag
-                        cmd = [
-                            "spotdl",
-                            "--output", dir_path,
-                            "--format", self.audio_format,
-                            "--bitrate", self.bitrate,
-                            "--resume"  # Add resume flag
-                        ]
-                        
-                        # Try to extract a Spotify URL from the filename
-                        # This is a heuristic approach and may not work for all files
-                        meta_file = f"{original_name}.spotdlTrackingFile"
-                        if os.path.exists(meta_file):
-                            try:
-                                with open(meta_file, 'r') as f:
-                                    content = f.read()
-                                    if 'spotify.com' in content:
-                                        spotify_url = re.search(r'https://open\.spotify\.com/[^\s"\']+', content)
-                                        if spotify_url:
-                                            cmd.append(spotify_url.group(0))
-                            except:
-                                pass
-                        
-                        if len(cmd) <= 5:  # No URL was added
-                            # Just try to resume based on the file path
-                            cmd.append(original_name)
-                        
-                        # Run the command
-                        subprocess.run(cmd, capture_output=True, text=True)
-                        progress.update(task, advance=1)
-                        
-                    except Exception as e:
-                        logger.error(f"Error resuming download {file_path}: {e}")
+                # Resume in parallel on the shared download pool; each resume is a
+                # separate spotdl process so they are independent of each other
+                resume_futures = [
+                    self.executor.submit(self._resume_partial_download, file_path)
+                    for file_path in partial_files
+                ]
+                failed = 0
+                for future in as_completed(resume_futures):
+                    if not future.result():
+                        failed += 1
+                    progress.update(task, advance=1)
                         
-            console.print("[green]Resume attempts completed.[/green]")
+            if failed:
+                console.print(f"[yellow]Could not resume {failed} of {len(partial_files)} downloads. See the log for details.[/yellow]")
+            else:
+                console.print("[green]Resume attempts completed.[/green]")
         
         return True
 
+    def _find_partial_files(self, root_dir):
+        """Recursively find partially downloaded files under a directory.
+        
+        Uses an explicit os.scandir stack rather than os.walk, so each
+        directory is read once and file/dir checks come from the cached
+        DirEntry type instead of extra stat calls.
+        
+        Args:
+            root_dir: Directory to search
+            
+        Returns:
+            list: Paths of files ending in .part or .tmp
+        """
+        partial_files = []
+        pending_dirs = [root_dir]
+        while pending_dirs:
+            current_dir = pending_dirs.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending_dirs.append(entry.path)
+                        elif entry.name.endswith(('.part', '.tmp')):
+                            partial_files.append(entry.path)
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory {current_dir}: {e}")
+        return partial_files
 
-def main():
-    """Main entry point."""
-    # Check terminal size first before parsing arguments
-    if not check_terminal_size():
-        width, height = app_state["terminal_size"]["width"], app_state["terminal_size"]["height"]
-        print(f"\033[31mError: Terminal size too small ({width}x{height})\033[0m")
-        print(f"\033[33mMinimum required terminal size: {MIN_TERMINAL_WIDTH}x{MIN_TERMINAL_HEIGHT}\033[0m")
-        print("\033[33mPlease resize your terminal window and try again.\033[0m")
-        return 1
+    def _resume_partial_download(self, file_path):
+        """Attempt to resume a single interrupted download with spotdl.
         
+        Args:
+            file_path: Path to the partial (.part/.tmp) file
+            
+        Returns:
+            bool: True if spotdl exited successfully
+        """
+        try:
+            # Extract the original filename from the partial file
+            original_name = file_path.replace('.part', '').replace('.tmp', '')
+            dir_path = os.path.dirname(file_path)
+            
+            # Build spotdl command with resume flag
+            cmd = [
+                "spotdl",
+                "--output", dir_path,
+                "--format", self.audio_format,
+                "--bitrate", self.bitrate,
+                "--resume"  # Add resume flag
+            ]
+            
+            # Try to extract a Spotify URL from the filename
+            # This is a heuristic approach and may not work for all files
+            url_found = False
+            meta_file = f"{original_name}.spotdlTrackingFile"
+            if os.path.exists(meta_file):
+                try:
+                    with open(meta_file, 'r') as f:
+                        content = f.read()
+                        if 'spotify.com' in content:
+                            spotify_url = SPOTIFY_URL_RE.search(content)
+                            if spotify_url:
+                                cmd.append(spotify_url.group(0))
+                                url_found = True
+                except:
+                    pass
+            
+            if not url_found:
+                # spotdl would treat the file path as a search query and could
+                # download an unrelated match, so only resume known URLs
+                logger.warning(f"No Spotify URL recorded for {file_path}, not resuming")
+                return False
+            
+            # Run the command
+            process = subprocess.run(cmd, capture_output=True, text=True)
+            return process.returncode == 0
+            
+        except Exception as e:
+            logger.error(f"Error resuming download {file_path}: {e}")
+            return False
+
+
+@lru_cache(maxsize=None)
+def build_arg_parser():
+    """Build the command line argument parser.
+    
+    The parser is constructed once and reused on subsequent calls.
+    
+    Returns:
+        argparse.ArgumentParser: The configured parser
+    """
     parser = argparse.ArgumentParser(
         description="Spotify Album Downloader and Burner - Search, download, and burn music from Spotify."
     )
@@ -3262,13 +3528,33 @@ def main():
         "--type", choices=["song", "album", "playlist", "all"], default="all",
         help="Type of content to search for (default: all)"
     )
-    
-    args = parser.parse_args()
-    
-    # Check for pywin32 availability on Windows and show a warning if missing
+    return parser
+
+
+@lru_cache(maxsize=None)
+def warn_missing_pywin32():
+    """Warn once per process if pywin32 is unavailable on Windows."""
     if (sys.platform == "win32" or sys.platform == "win64") and not WINDOWS_IMAPI_AVAILABLE:
         console.print("[yellow]Warning: pywin32 is not installed. Some CD/DVD burning features will be limited.[/yellow]")
         console.print("[yellow]Install pywin32 for full functionality: pip install pywin32[/yellow]")
+
+
+def main():
+    """Main entry point."""
+    init_runtime()
+    
+    # Check terminal size first before parsing arguments
+    if not check_terminal_size():
+        width, height = app_state["terminal_size"]["width"], app_state["terminal_size"]["height"]
+        print(f"\033[31mError: Terminal size too small ({width}x{height})\033[0m")
+        print(f"\033[33mMinimum required terminal size: {MIN_TERMINAL_WIDTH}x{MIN_TERMINAL_HEIGHT}\033[0m")
+        print("\033[33mPlease resize your terminal window and try again.\033[0m")
+        return 1
+        
+    args = build_arg_parser().parse_args()
+    
+    # Check for pywin32 availability on Windows and show a warning if missing
+    warn_missing_pywin32()
     
     app = SpotifyBurner()
     
@@ -0,0 +1,76 @@
+"""Tests for update_cdburnerxp_path.main()."""
+import builtins
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import update_cdburnerxp_path  # noqa: E402
+
+BURNER_PATH = "D:\\Tools\\CDBurnerXP\\cdbxpcmd.exe"
+
+
+@pytest.fixture
+def configs(tmp_path, monkeypatch):
+    """Point both config constants into tmp_path and record file opens."""
+    portable = tmp_path / "PortableData" / "config.json"
+    portable.parent.mkdir()
+    default = tmp_path / "config.json"
+    monkeypatch.setattr(update_cdburnerxp_path, "PORTABLE_CONFIG", str(portable))
+    monkeypatch.setattr(update_cdburnerxp_path, "DEFAULT_CONFIG", str(default))
+    monkeypatch.setenv("CDBURNERXP_PATH", BURNER_PATH)
+
+    opened = []
+
+    def recording_open(path, mode="r", *args, **kwargs):
+        opened.append((str(path), mode))
+        return builtins.open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr(update_cdburnerxp_path, "open", recording_open, raising=False)
+    return portable, default, opened
+
+
+def write_config(path, data):
+    path.write_text(json.dumps(data, indent=4))
+
+
+def test_sets_cdburnerxp_path(configs):
+    portable, default, opened = configs
+    write_config(portable, {"theme": "dark"})
+    write_config(default, {"burn_settings": {"cdburnerxp_path": "C:\\old.exe", "eject": True}})
+
+    update_cdburnerxp_path.main()
+
+    portable_data = json.loads(portable.read_text())
+    assert portable_data["burn_settings"]["cdburnerxp_path"] == BURNER_PATH
+    assert portable_data["theme"] == "dark"
+    default_data = json.loads(default.read_text())
+    assert default_data["burn_settings"] == {"cdburnerxp_path": BURNER_PATH, "eject": True}
+
+
+def test_skips_config_that_is_already_current(configs):
+    portable, default, opened = configs
+    write_config(default, {"burn_settings": {"cdburnerxp_path": BURNER_PATH}})
+    before = default.read_text()
+
+    update_cdburnerxp_path.main()
+
+    assert default.read_text() == before
+    assert (str(default), "w") not in opened
+    assert not portable.exists()
+
+
+def test_reports_and_skips_unreadable_config(configs, capsys):
+    portable, default, opened = configs
+    portable.write_text("{not valid json")
+    write_config(default, {})
+
+    update_cdburnerxp_path.main()
+
+    assert f"Failed to load {portable}" in capsys.readouterr().err
+    assert portable.read_text() == "{not valid json"
+    assert (str(portable), "w") not in opened
+    assert json.loads(default.read_text())["burn_settings"]["cdburnerxp_path"] == BURNER_PATH
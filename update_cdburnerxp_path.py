@@ -8,44 +8,47 @@ import os
 import sys
 
 # Determine workspace root (script's directory)
-script_dir = os.path.abspath(os.path.dirname(__file__))
+SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
 
 # Paths to config files
-def portable_config():
-    return os.path.join(script_dir, 'PortableData', 'config.json')
-def default_config():
-    return os.path.join(script_dir, 'config.json')
-
-configs = []
-# Portable config always exists
-p_cfg = portable_config()
-if os.path.exists(p_cfg):
-    configs.append(p_cfg)
-# Default config may exist
-d_cfg = default_config()
-if os.path.exists(d_cfg):
-    configs.append(d_cfg)
-
-# Get CDBurnerXP path from environment variable
-burner_path = os.environ.get('CDBURNERXP_PATH', '')
-if not burner_path:
-    print('Warning: CDBURNERXP_PATH environment variable is not set')
-
-for cfg_path in configs:
-    try:
-        print(f'Updating {cfg_path}')
-        with open(cfg_path, 'r') as f:
-            data = json.load(f)
-    except Exception as e:
-        print(f'Failed to load {cfg_path}: {e}', file=sys.stderr)
-        continue
-    # Ensure burn_settings
-    bs = data.setdefault('burn_settings', {})
-    bs['cdburnerxp_path'] = burner_path
-    # Write back
-    try:
-        with open(cfg_path, 'w') as f:
-            json.dump(data, f, indent=4)
-        print(f'Successfully updated {cfg_path}')
-    except Exception as e:
-        print(f'Failed to write {cfg_path}: {e}', file=sys.stderr)
+PORTABLE_CONFIG = os.path.join(SCRIPT_DIR, 'PortableData', 'config.json')
+DEFAULT_CONFIG = os.path.join(SCRIPT_DIR, 'config.json')
+
+def main():
+    """Point burn_settings.cdburnerxp_path in each config at CDBURNERXP_PATH."""
+    # Portable config always exists; default config may exist
+    configs = [p for p in (PORTABLE_CONFIG, DEFAULT_CONFIG) if os.path.exists(p)]
+
+    # Get CDBurnerXP path from environment variable
+    burner_path = os.environ.get('CDBURNERXP_PATH', '')
+    if not burner_path:
+        print('Warning: CDBURNERXP_PATH environment variable is not set')
+
+    # Read every config first so each file is opened once per pass
+    entries = []
+    for cfg_path in configs:
+        try:
+            with open(cfg_path, 'r') as f:
+                entries.append((cfg_path, json.load(f)))
+        except Exception as e:
+            print(f'Failed to load {cfg_path}: {e}', file=sys.stderr)
+
+    for cfg_path, data in entries:
+        # Ensure burn_settings
+        bs = data.setdefault('burn_settings', {})
+        if bs.get('cdburnerxp_path') == burner_path:
+            print(f'{cfg_path} is already up to date')
+            continue
+        bs['cdburnerxp_path'] = burner_path
+        # Write back
+        try:
+            print(f'Updating {cfg_path}')
+            with open(cfg_path, 'w') as f:
+                json.dump(data, f, indent=4)
+            print(f'Successfully updated {cfg_path}')
+        except Exception as e:
+            print(f'Failed to write {cfg_path}: {e}', file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()